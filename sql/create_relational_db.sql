@@ -21,12 +21,32 @@ CREATE TABLE customers (
     PRIMARY KEY (customer_id)
 );
 
+-- Partitioned by month on timestamp so date-range queries prune to the relevant
+-- partitions and retention drops whole partitions (see src/partitions.py).
+-- MySQL requires the partition column in every unique key, so the primary key is
+-- (order_id, timestamp) and order_id is no longer unique on its own. Look orders up by
+-- both columns so the query prunes to one partition.
+-- MySQL does not support foreign keys on partitioned tables, so the references to
+-- products and customers are plain indexes.
 CREATE TABLE orders (
     order_id INT NOT NULL,
-    timestamp DATETIME,
+    timestamp DATETIME NOT NULL,
     customer_id INT NOT NULL,
     product_id INT NOT NULL,
-    PRIMARY KEY (order_id),
-    CONSTRAINT fk_orders_products FOREIGN KEY (product_id) REFERENCES products(product_id) ON DELETE CASCADE,
-    CONSTRAINT fk_orders_customer FOREIGN KEY (customer_id) REFERENCES customers(customer_id) ON DELETE CASCADE
+    PRIMARY KEY (order_id, timestamp),
+    KEY idx_orders_customer (customer_id),
+    KEY idx_orders_product (product_id)
+)
+PARTITION BY RANGE COLUMNS (timestamp) (
+    PARTITION p202503 VALUES LESS THAN ('2025-04-01'),
+    PARTITION p202504 VALUES LESS THAN ('2025-05-01'),
+    PARTITION p202505 VALUES LESS THAN ('2025-06-01'),
+    PARTITION p202506 VALUES LESS THAN ('2025-07-01'),
+    PARTITION p202507 VALUES LESS THAN ('2025-08-01'),
+    PARTITION p202508 VALUES LESS THAN ('2025-09-01'),
+    PARTITION p202509 VALUES LESS THAN ('2025-10-01'),
+    PARTITION p202510 VALUES LESS THAN ('2025-11-01'),
+    PARTITION p202511 VALUES LESS THAN ('2025-12-01'),
+    PARTITION p202512 VALUES LESS THAN ('2026-01-01'),
+    PARTITION p_future VALUES LESS THAN (MAXVALUE)
 );
\ No newline at end of file
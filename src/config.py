@@ -21,6 +21,7 @@ CREATE_ORDERS_COMBINED = BASE_DIR / SQL_DIR / "create_orders_combined.sql"
 # DB
 DB_NAME = "db"
 DB_TEST_NAME = "test_db"
+RELATIONAL_DB_NAME = "relational_db"
 
 
 @dataclass (frozen=True)
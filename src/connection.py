@@ -44,8 +44,8 @@ class DatabaseConnection:
         if exc_type is None:
             self.commit()
         else:
-            self.connection.rollback()
-        self.connection.close()
+            self.rollback()
+        self.close()
         return False
 
     def is_connected(self) -> bool:
@@ -94,4 +94,22 @@ class DatabaseConnection:
             mysql.connector.Error: If commit fails.
         """
         if self.is_connected():
-            self.connection.commit()
\ No newline at end of file
+            self.connection.commit()
+
+    def rollback(self) -> None:
+        """Roll back the current transaction.
+
+        Raises:
+            mysql.connector.Error: If rollback fails.
+        """
+        if self.is_connected():
+            self.connection.rollback()
+
+    def close(self) -> None:
+        """Close the connection without committing.
+
+        Raises:
+            mysql.connector.Error: If closing fails.
+        """
+        if self.is_connected():
+            self.connection.close()
\ No newline at end of file
@@ -0,0 +1,194 @@
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional
+
+import mysql.connector
+
+from config import DatabaseConnectionConfig
+from connection import DatabaseConnection
+from filters import Aggregate, Desc, Filters
+from rows import RowBlock
+from table import Table
+
+
+@dataclass(frozen=True)
+class SelectQuery:
+    """The arguments of one Table.select call to run on the executor."""
+
+    table_name: str
+    cols: tuple[str | Aggregate, ...]
+    filters: Optional[Filters] = None
+    limit: int | None = None
+    order_by: Optional[tuple[str | Aggregate | Desc, ...]] = None
+    group_by: Optional[tuple[str, ...]] = None
+    row_format: str = "tuple"
+
+
+class QueryExecutor:
+    """Runs batches of selects concurrently, one DatabaseConnection per worker thread.
+
+    mysql.connector connections are not thread safe, so every worker lazily opens
+    its own connection and reuses it for all queries it runs, reopening it if it dropped.
+
+    Example:
+        dbconfig = replace(config.dbconfig, database=config.RELATIONAL_DB_NAME)
+        with QueryExecutor(dbconfig, max_workers=8, timeout=5) as executor:
+            results = executor.run([
+                SelectQuery("orders", ("order_id",), filters={"product_id": product_id})
+                for product_id in range(10)
+            ])
+    """
+
+    # Extra seconds the caller waits on top of the server side timeout before giving up
+    CLIENT_TIMEOUT_MARGIN = 1.0
+
+    def __init__(
+        self,
+        config: DatabaseConnectionConfig,
+        max_workers: int = 4,
+        timeout: float | None = None,
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            config: DatabaseConnectionConfig used to open a connection per worker.
+            max_workers: Maximum number of queries, and connections, in flight at once.
+            timeout: Optional per-query timeout in seconds, enforced by the server
+                through max_execution_time and by the caller waiting on the results.
+
+        Raises:
+            ValueError: If max_workers is not positive or timeout is not positive.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive")
+
+        self.config = config
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="query")
+        self._local = threading.local()
+        self._connections: list[DatabaseConnection] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "QueryExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+    def _get_connection(self) -> DatabaseConnection:
+        """Returns the calling worker's connection, opening it on first use or after it dropped."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and connection.is_connected():
+            return connection
+
+        if connection is not None:
+            with self._lock:
+                self._connections.remove(connection)
+            # A broken socket can still be open, close it instead of waiting for garbage collection
+            try:
+                connection.connection.close()
+            except mysql.connector.Error:
+                pass
+        connection = DatabaseConnection(self.config)
+        if self.timeout is not None:
+            # max_execution_time = 0 means no limit, so never round a small timeout down to 0
+            with connection.cursor() as cur:
+                cur.execute("SET SESSION max_execution_time = %s", [max(1, round(self.timeout * 1000))])
+        self._local.connection = connection
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+
+    def _batch_timeout(self, num_queries: int) -> float | None:
+        """Returns how long a batch may take, each worker runs its share of queries one after another."""
+        if self.timeout is None:
+            return None
+        rounds = math.ceil(num_queries / self.max_workers)
+        return rounds * (self.timeout + self.CLIENT_TIMEOUT_MARGIN)
+
+    def _execute(self, query: SelectQuery) -> list[Any] | RowBlock:
+        connection = self._get_connection()
+        table = Table(query.table_name, connection)
+        try:
+            return table.select(
+                query.cols,
+                filters=query.filters,
+                limit=query.limit,
+                order_by=query.order_by,
+                group_by=query.group_by,
+                row_format=query.row_format,
+            )
+        finally:
+            # End the read transaction so the next query sees fresh data
+            connection.commit()
+
+    def submit(self, query: SelectQuery) -> Future:
+        """Schedules a single query.
+
+        Returns:
+            Future: Resolves to the rows returned by Table.select.
+        """
+        return self._pool.submit(self._execute, query)
+
+    def run(self, queries: Iterable[SelectQuery]) -> list[list[Any] | RowBlock]:
+        """Runs queries concurrently and returns their results in submission order.
+
+        Args:
+            queries: The select specs to run.
+
+        Raises:
+            mysql.connector.Error: If a query fails or exceeds the timeout.
+            TimeoutError: If the server did not answer within the timeout, pending queries are cancelled.
+
+        Returns:
+            list[list[Any] | RowBlock]: One result list per query, in the order submitted.
+        """
+        futures = [self.submit(query) for query in queries]
+        batch_timeout = self._batch_timeout(len(futures))
+        deadline = None if batch_timeout is None else time.monotonic() + batch_timeout
+        try:
+            return [
+                future.result(None if deadline is None else max(0.0, deadline - time.monotonic()))
+                for future in futures
+            ]
+        except TimeoutError:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def run_as_completed(self, queries: Iterable[SelectQuery]) -> Iterator[tuple[int, list[Any] | RowBlock]]:
+        """Runs queries concurrently and yields results as soon as each finishes.
+
+        Args:
+            queries: The select specs to run.
+
+        Raises:
+            mysql.connector.Error: If a query fails or exceeds the timeout.
+            TimeoutError: If the server did not answer within the timeout, pending queries are cancelled.
+
+        Yields:
+            tuple[int, list[Any] | RowBlock]: The submission index of the query and its rows.
+        """
+        futures = {self.submit(query): index for index, query in enumerate(queries)}
+        try:
+            for future in as_completed(futures, timeout=self._batch_timeout(len(futures))):
+                yield futures[future], future.result()
+        except TimeoutError:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def close(self) -> None:
+        """Waits for running queries and closes every worker connection."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
@@ -0,0 +1,158 @@
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+COMPARISON_OPERATORS = {"=", "!=", "<", "<=", ">", ">="}
+OPERATORS = COMPARISON_OPERATORS | {"BETWEEN", "IN", "IS NULL", "IS NOT NULL"}
+AGGREGATE_FUNCTIONS = {"COUNT", "SUM", "AVG", "MIN", "MAX"}
+
+
+@dataclass(frozen=True)
+class Condition:
+    """A single column predicate compiled to a parameterized WHERE fragment.
+
+    Example:
+        Condition("price", ">=", 100)
+        Condition("timestamp", "BETWEEN", ("2025-03-01", "2025-04-01"))
+        Condition("product_id", "IN", [1, 2, 3])
+        Condition("email", "IS NULL")
+    """
+
+    column: str
+    operator: str
+    value: Any = None
+
+    def __post_init__(self) -> None:
+        if self.operator not in OPERATORS:
+            raise ValueError(
+                f"Invalid operator: {self.operator} is not in valid operators: {OPERATORS}")
+        if self.operator in COMPARISON_OPERATORS and self.value is None:
+            raise ValueError(
+                f"Cannot compare {self.column} {self.operator} NULL, use IS NULL or IS NOT NULL instead")
+        if self.operator == "BETWEEN" and (
+                not isinstance(self.value, (tuple, list)) or len(self.value) != 2):
+            raise ValueError("BETWEEN requires a (low, high) pair")
+        if self.operator == "BETWEEN" and None in self.value:
+            raise ValueError(
+                f"Cannot compare {self.column} BETWEEN NULL bounds, use IS NULL or IS NOT NULL instead")
+        if self.operator == "IN":
+            # Materialize once so a generator is not consumed by the checks
+            values = tuple(self.value or ())
+            if not values:
+                raise ValueError("IN requires at least one value")
+            if None in values:
+                raise ValueError(
+                    f"Cannot match {self.column} IN a list containing NULL, use IS NULL instead")
+            object.__setattr__(self, "value", values)
+
+    def columns(self) -> set[str]:
+        return {self.column}
+
+    def compile(self) -> tuple[str, list[Any]]:
+        """Compiles the condition to a SQL fragment and its parameter values.
+
+        Returns:
+            tuple[str, list[Any]]: The SQL fragment with %s placeholders and the values to bind.
+        """
+        if self.operator in COMPARISON_OPERATORS:
+            return f"{self.column} {self.operator} %s", [self.value]
+        if self.operator == "BETWEEN":
+            low, high = self.value
+            return f"{self.column} BETWEEN %s AND %s", [low, high]
+        if self.operator == "IN":
+            values = list(self.value)
+            return f"{self.column} IN ({', '.join(['%s'] * len(values))})", values
+        return f"{self.column} {self.operator}", []
+
+
+class _Group:
+    """Base class for conditions joined by a boolean keyword."""
+
+    keyword = ""
+
+    def __init__(self, *conditions: "Condition | _Group") -> None:
+        if not conditions:
+            raise ValueError(f"{self.keyword} group requires at least one condition")
+        self.conditions = conditions
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self.conditions == other.conditions
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}{self.conditions!r}"
+
+    def columns(self) -> set[str]:
+        return set().union(*(condition.columns() for condition in self.conditions))
+
+    def compile(self) -> tuple[str, list[Any]]:
+        """Compiles the group, parenthesizing nested groups to keep precedence explicit.
+
+        Returns:
+            tuple[str, list[Any]]: The SQL fragment with %s placeholders and the values to bind.
+        """
+        parts = []
+        values = []
+        for condition in self.conditions:
+            sql, params = condition.compile()
+            if isinstance(condition, _Group) and len(condition.conditions) > 1:
+                sql = f"({sql})"
+            parts.append(sql)
+            values.extend(params)
+        return f" {self.keyword} ".join(parts), values
+
+
+class And(_Group):
+    keyword = "AND"
+
+
+class Or(_Group):
+    keyword = "OR"
+
+
+Filters = dict[str, Any] | Condition | _Group | Iterable[Condition | _Group]
+
+
+def to_expression(filters: Filters) -> Condition | _Group:
+    """Normalizes the accepted filter forms to a single expression.
+
+    A dict is treated as equality conditions joined with AND, with None values
+    compiled to IS NULL, and an iterable of conditions or groups is joined with AND.
+
+    Args:
+        filters: dict, Condition, And/Or group or iterable of conditions.
+
+    Returns:
+        Condition | _Group: The expression to compile.
+    """
+    if isinstance(filters, (Condition, _Group)):
+        return filters
+    if isinstance(filters, dict):
+        return And(*(
+            Condition(col, "IS NULL") if value is None else Condition(col, "=", value)
+            for col, value in filters.items()
+        ))
+    return And(*filters)
+
+
+@dataclass(frozen=True)
+class Aggregate:
+    """An aggregate select column, e.g. Aggregate("SUM", "price") -> SUM(price)."""
+
+    function: str
+    column: str = "*"
+
+    def __post_init__(self) -> None:
+        if self.function not in AGGREGATE_FUNCTIONS:
+            raise ValueError(
+                f"Invalid aggregate: {self.function} is not in valid aggregates: {AGGREGATE_FUNCTIONS}")
+        if self.column == "*" and self.function != "COUNT":
+            raise ValueError(f"{self.function} requires a column, only COUNT supports *")
+
+    def compile(self) -> str:
+        return f"{self.function}({self.column})"
+
+
+@dataclass(frozen=True)
+class Desc:
+    """Orders by a column or aggregate in descending order, e.g. Desc(Aggregate("COUNT"))."""
+
+    expression: str | Aggregate
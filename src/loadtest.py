@@ -0,0 +1,459 @@
+"""Load generator driving mixed CRUD traffic against the relational schema.
+
+Run:
+    uv run src/loadtest.py --workers 16 --duration 60 --rate 500
+"""
+
+import argparse
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from functools import partial
+from itertools import count
+from typing import Any, Callable
+
+import mysql.connector
+from mysql.connector import errorcode
+
+import config
+import utils
+from config import DatabaseConnectionConfig
+from connection import DatabaseConnection
+from filters import Aggregate, Condition
+from table import Table
+
+OPERATIONS = ("insert", "select", "update", "delete")
+CONNECTION_LOST_ERRNOS = {
+    errorcode.CR_SERVER_GONE_ERROR, errorcode.CR_SERVER_LOST, errorcode.CR_SERVER_LOST_EXTENDED}
+# Seconds between attempts to reopen a lost connection, so a down server is not hammered
+RECONNECT_BACKOFF = 0.1
+
+
+@dataclass(frozen=True)
+class LoadTestConfig:
+    """Shape of the generated traffic.
+
+    Attributes:
+        workers: Number of threads, each with its own connection.
+        duration: Seconds to generate traffic for.
+        rate: Target operations per second across all workers, None runs closed loop.
+        mix: Relative weight of each operation in OPERATIONS.
+        sample_interval: Seconds between connection count samples.
+        seed: Optional seed to make the generated traffic reproducible.
+    """
+
+    workers: int = 8
+    duration: float = 30.0
+    rate: float | None = None
+    mix: dict[str, float] = field(
+        default_factory=lambda: {"insert": 0.2, "select": 0.6, "update": 0.15, "delete": 0.05})
+    sample_interval: float = 1.0
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.workers < 1:
+            raise ValueError("workers must be positive")
+        if self.duration <= 0:
+            raise ValueError("duration must be positive")
+        if self.rate is not None and self.rate <= 0:
+            raise ValueError("rate must be positive")
+        invalid_ops = set(self.mix) - set(OPERATIONS)
+        if invalid_ops:
+            raise ValueError(f"Invalid operation: {invalid_ops} is not in valid operations: {OPERATIONS}")
+        negative_ops = {operation for operation, weight in self.mix.items() if weight < 0}
+        if negative_ops:
+            raise ValueError(f"Invalid weight: {negative_ops} must not have a negative weight")
+        if sum(self.mix.values()) <= 0:
+            raise ValueError("mix must contain a positive weight")
+
+
+@dataclass
+class OperationStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    deadlocks: int = 0
+    lock_timeouts: int = 0
+
+    @property
+    def total(self) -> int:
+        return len(self.latencies) + self.errors
+
+    def merge(self, other: "OperationStats") -> None:
+        self.latencies.extend(other.latencies)
+        self.errors += other.errors
+        self.deadlocks += other.deadlocks
+        self.lock_timeouts += other.lock_timeouts
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Returns the p-th percentile of values using the nearest-rank method.
+
+    Args:
+        values: The samples, in any order.
+        p: The percentile between 0 and 100.
+
+    Returns:
+        float: The percentile, or 0.0 if there are no samples.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass
+class LoadReport:
+    elapsed: float
+    stats: dict[str, OperationStats]
+    connection_samples: list[tuple[float, int]]
+
+    def summary(self) -> str:
+        """Formats throughput, latency percentiles, error rates and connection counts as a table."""
+        lines = [
+            f"{'operation':<10}{'ops':>8}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+            f"{'p99 ms':>10}{'errors':>8}{'deadlocks':>11}{'lock waits':>12}"
+        ]
+        total = OperationStats()
+        for name, stats in [*self.stats.items(), ("total", total)]:
+            if name != "total":
+                total.merge(stats)
+            lines.append(
+                f"{name:<10}{stats.total:>8}{stats.total / self.elapsed:>10.1f}"
+                f"{percentile(stats.latencies, 50) * 1000:>10.2f}"
+                f"{percentile(stats.latencies, 95) * 1000:>10.2f}"
+                f"{percentile(stats.latencies, 99) * 1000:>10.2f}"
+                f"{stats.errors:>8}{stats.deadlocks:>11}{stats.lock_timeouts:>12}"
+            )
+        if total.total:
+            lines.append(
+                f"error rate {total.errors / total.total:.2%}, deadlock rate {total.deadlocks / total.total:.2%}, "
+                f"lock wait timeout rate {total.lock_timeouts / total.total:.2%}")
+        lines.append("connections over time (s: Threads_connected)")
+        lines.extend(f"  {elapsed:6.1f}: {connected}" for elapsed, connected in self.connection_samples)
+        return "\n".join(lines)
+
+
+class SyntheticOrders:
+    """Generates rows shaped like data/orders.csv referencing existing customers and products.
+
+    Shared between workers, so ids handed out for insert, update and delete are guarded by a lock.
+    Only committed orders are in the pool update and delete pick from.
+    """
+
+    def __init__(
+        self,
+        customer_ids: list[int],
+        product_ids: list[int],
+        first_order_id: int,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        if not customer_ids or not product_ids:
+            raise ValueError("Cannot generate orders without customers and products")
+        self.customer_ids = customer_ids
+        self.product_ids = product_ids
+        self.start = start
+        self.span = (end - start).total_seconds()
+        self._next_id = count(first_order_id)
+        # (order_id, timestamp) is the primary key of the partitioned orders table
+        self._order_keys: list[tuple[int, datetime]] = []
+        self._lock = threading.Lock()
+
+    def timestamp(self, rng: random.Random) -> datetime:
+        return self.start + timedelta(seconds=int(rng.random() * self.span))
+
+    def new_order(self, rng: random.Random) -> dict[str, Any]:
+        with self._lock:
+            order_id = next(self._next_id)
+        return {
+            "order_id": order_id,
+            "timestamp": self.timestamp(rng),
+            "customer_id": rng.choice(self.customer_ids),
+            "product_id": rng.choice(self.product_ids),
+        }
+
+    def add_order(self, order_id: int, timestamp: datetime) -> None:
+        """Makes a committed order available to update and delete."""
+        with self._lock:
+            self._order_keys.append((order_id, timestamp))
+
+    def existing_order(self, rng: random.Random, remove: bool = False) -> tuple[int, datetime] | None:
+        """Picks the (order_id, timestamp) key of a load test order, optionally removing it for delete."""
+        with self._lock:
+            if not self._order_keys:
+                return None
+            index = rng.randrange(len(self._order_keys))
+            if not remove:
+                return self._order_keys[index]
+            # Swap with the last key so removal is O(1)
+            self._order_keys[index], self._order_keys[-1] = self._order_keys[-1], self._order_keys[index]
+            return self._order_keys.pop()
+
+
+def run_operation(operation: str, orders: Table, data: SyntheticOrders, rng: random.Random) -> bool:
+    """Runs one operation of the mix against the orders table.
+
+    Returns:
+        bool: False if there was no order to update or delete, so nothing was sent to the server.
+    """
+    if operation == "insert":
+        row = data.new_order(rng)
+        orders.insert(row)
+        data.add_order(row["order_id"], row["timestamp"])
+    elif operation == "select":
+        if rng.random() < 0.5:
+            orders.select(["*"], filters={"customer_id": rng.choice(data.customer_ids)})
+        else:
+            start = data.timestamp(rng)
+            orders.select(
+                ["product_id", Aggregate("COUNT")],
+                filters=Condition("timestamp", "BETWEEN", (start, start + timedelta(days=1))),
+                group_by=["product_id"],
+            )
+    elif operation == "update":
+        key = data.existing_order(rng)
+        if key is None:
+            return False
+        # Filtering on the whole primary key lets MySQL prune to the order's partition
+        order_id, timestamp = key
+        orders.update(
+            {"product_id": rng.choice(data.product_ids)}, {"order_id": order_id, "timestamp": timestamp})
+    elif operation == "delete":
+        key = data.existing_order(rng, remove=True)
+        if key is None:
+            return False
+        order_id, timestamp = key
+        try:
+            orders.delete({"order_id": order_id, "timestamp": timestamp})
+            orders.connection.commit()
+        except mysql.connector.Error:
+            # The delete is rolled back, so the order still exists
+            data.add_order(order_id, timestamp)
+            raise
+    return True
+
+
+def reconnect(
+    connection: DatabaseConnection,
+    connect: Callable[[], DatabaseConnection],
+    deadline: float,
+) -> DatabaseConnection | None:
+    """Closes a lost connection and opens a new one, retrying until deadline.
+
+    Returns:
+        DatabaseConnection | None: The new connection, or None if the server stayed unreachable.
+    """
+    try:
+        connection.connection.close()
+    except mysql.connector.Error:
+        pass
+    while time.monotonic() < deadline:
+        try:
+            return connect()
+        except mysql.connector.Error:
+            time.sleep(RECONNECT_BACKOFF)
+    return None
+
+
+def run_worker(
+    connect: Callable[[], DatabaseConnection],
+    data: SyntheticOrders,
+    load_config: LoadTestConfig,
+    rng: random.Random,
+    deadline: float,
+    operation_runner: Callable[[str, Table, SyntheticOrders, random.Random], bool] = run_operation,
+) -> dict[str, OperationStats]:
+    """Issues operations on one connection until deadline, paced to the worker's share of the rate.
+
+    The worker opens its connection with connect, reopens it when the server connection
+    is lost and closes it when done. With a rate, latency is measured from each operation's
+    scheduled start, so time spent queueing behind a slow worker counts toward the percentiles.
+
+    Returns:
+        dict[str, OperationStats]: Latencies and errors per operation for this worker.
+    """
+    operations = list(load_config.mix)
+    weights = list(load_config.mix.values())
+    interval = load_config.workers / load_config.rate if load_config.rate else None
+    stats = {operation: OperationStats() for operation in operations}
+    connection = connect()
+    orders = Table("orders", connection)
+    next_start = time.monotonic()
+
+    try:
+        while time.monotonic() < deadline:
+            if interval is not None:
+                started = next_start
+                delay = started - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                next_start += interval
+            else:
+                started = time.monotonic()
+
+            operation = rng.choices(operations, weights)[0]
+            try:
+                performed = operation_runner(operation, orders, data, rng)
+                # Table.delete and select leave the transaction open
+                connection.commit()
+            except mysql.connector.Error as err:
+                stats[operation].errors += 1
+                if err.errno == errorcode.ER_LOCK_DEADLOCK:
+                    stats[operation].deadlocks += 1
+                elif err.errno == errorcode.ER_LOCK_WAIT_TIMEOUT:
+                    stats[operation].lock_timeouts += 1
+
+                if err.errno in CONNECTION_LOST_ERRNOS:
+                    connection = reconnect(connection, connect, deadline)
+                    if connection is None:
+                        break
+                    orders = Table("orders", connection)
+                else:
+                    connection.rollback()
+            else:
+                if performed:
+                    stats[operation].latencies.append(time.monotonic() - started)
+    finally:
+        if connection is not None:
+            connection.close()
+    return stats
+
+
+def sample_connections(
+    connection: DatabaseConnection,
+    interval: float,
+    stop: threading.Event,
+    samples: list[tuple[float, int]],
+) -> None:
+    """Records the server's Threads_connected every interval until stop is set."""
+    started = time.monotonic()
+    while True:
+        with connection.cursor() as cur:
+            cur.execute("SHOW GLOBAL STATUS LIKE 'Threads_connected'")
+            _, connected = cur.fetchone()
+        samples.append((time.monotonic() - started, int(connected)))
+        if stop.wait(interval):
+            break
+
+
+def load_synthetic_orders(connection: DatabaseConnection) -> SyntheticOrders:
+    """Builds the generator from the customers, products and orders already in the database."""
+    customer_ids = [row[0] for row in Table("customers", connection).select(["customer_id"])]
+    product_ids = [row[0] for row in Table("products", connection).select(["product_id"])]
+    first, last, max_id = Table("orders", connection).select(
+        [Aggregate("MIN", "timestamp"), Aggregate("MAX", "timestamp"), Aggregate("MAX", "order_id")])[0]
+    connection.commit()
+
+    now = datetime.now().replace(microsecond=0)
+    return SyntheticOrders(
+        customer_ids,
+        product_ids,
+        first_order_id=(max_id or 0) + 1,
+        start=first or now - timedelta(days=30),
+        end=last or now,
+    )
+
+
+def run_load_test(dbconfig: DatabaseConnectionConfig, load_config: LoadTestConfig) -> LoadReport:
+    """Drives load_config's traffic against dbconfig and collects the results.
+
+    Args:
+        dbconfig: Connection parameters, the database must contain the relational schema.
+        load_config: Workers, duration, rate and operation mix to generate.
+
+    Raises:
+        RuntimeError: If a worker thread died, chained to the first worker's exception.
+
+    Returns:
+        LoadReport: Throughput, latencies, errors and connection counts of the run.
+    """
+    seed_rng = random.Random(load_config.seed)
+    monitor = DatabaseConnection(dbconfig)
+    data = load_synthetic_orders(monitor)
+
+    results: list[dict[str, OperationStats]] = []
+    failures: list[Exception] = []
+    samples: list[tuple[float, int]] = []
+    stop = threading.Event()
+    started = time.monotonic()
+    deadline = started + load_config.duration
+
+    def work(rng: random.Random) -> None:
+        try:
+            results.append(run_worker(partial(DatabaseConnection, dbconfig), data, load_config, rng, deadline))
+        except Exception as err:
+            failures.append(err)
+
+    threads = [
+        threading.Thread(target=work, args=(random.Random(seed_rng.random()),))
+        for _ in range(load_config.workers)
+    ]
+    sampler = threading.Thread(target=sample_connections, args=(monitor, load_config.sample_interval, stop, samples))
+    try:
+        sampler.start()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+    finally:
+        stop.set()
+        sampler.join()
+        monitor.close()
+
+    if failures:
+        raise RuntimeError(
+            f"{len(failures)} of {load_config.workers} load test workers failed") from failures[0]
+
+    stats = {operation: OperationStats() for operation in load_config.mix}
+    for worker_stats in results:
+        for operation, operation_stats in worker_stats.items():
+            stats[operation].merge(operation_stats)
+    return LoadReport(elapsed, stats, samples)
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """Parses "insert=2,select=6,update=1,delete=1" into operation weights."""
+    mix = {}
+    for part in value.split(","):
+        operation, _, weight = part.partition("=")
+        mix[operation.strip()] = float(weight)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate concurrent mixed CRUD traffic against the relational schema")
+    parser.add_argument("--workers", type=int, default=LoadTestConfig.workers)
+    parser.add_argument("--duration", type=float, default=LoadTestConfig.duration)
+    parser.add_argument("--rate", type=float, default=None, help="total ops/s, omit for closed loop")
+    parser.add_argument("--mix", type=parse_mix, default=None, help="e.g. insert=2,select=6,update=1,delete=1")
+    parser.add_argument("--sample-interval", type=float, default=LoadTestConfig.sample_interval)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--setup", action="store_true", help="recreate the schema and load data/*.csv first")
+    args = parser.parse_args()
+
+    if args.setup:
+        with DatabaseConnection(config.dbconfig) as connection:
+            utils.run_sql_schema(config.CREATE_RELATIONAL_DB, connection)
+            Table("products", connection).insertmany(utils.load_csv_to_dict(config.PRODUCTS_CSV))
+            Table("customers", connection).insertmany(utils.load_csv_to_dict(config.CUSTOMERS_CSV))
+            Table("orders", connection).insertmany(utils.load_csv_to_dict(config.ORDERS_CSV))
+
+    load_config = LoadTestConfig(
+        workers=args.workers,
+        duration=args.duration,
+        rate=args.rate,
+        sample_interval=args.sample_interval,
+        seed=args.seed,
+        **({"mix": args.mix} if args.mix else {}),
+    )
+    report = run_load_test(replace(config.dbconfig, database=config.RELATIONAL_DB_NAME), load_config)
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,15 @@
 import config
 import utils
 from connection import DatabaseConnection
+from filters import Condition
+from partitions import PartitionManager
 from table import Table
 
 
 def main():
     with DatabaseConnection(config.dbconfig) as connection:
         utils.run_sql_schema(config.CREATE_RELATIONAL_DB, connection)
+        PartitionManager("orders", connection).ensure_future_partitions()
         orders = Table("orders", connection)
         products = Table("products", connection)
         customers = Table("customers", connection)
@@ -21,6 +24,10 @@ def main():
 
         result = products.select(["*"], filters={"product_name": "Laptop"})
         utils.print_iterable(result)
+        # orders is partitioned and cannot have foreign keys, so delete its rows before the product
+        laptop_ids = [row[0] for row in products.select(["product_id"], filters={"product_name": "Laptop"})]
+        if laptop_ids:
+            orders.delete(Condition("product_id", "IN", laptop_ids))
         products.delete({"product_name": "Laptop"})
         result = products.select(["*"], filters={"product_name": "Laptop"})
         utils.print_iterable(result)
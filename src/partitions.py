@@ -0,0 +1,191 @@
+"""Monthly RANGE COLUMNS partition management for time-series tables such as orders.
+
+MySQL prunes to the relevant partitions when the WHERE clause compares the raw
+partition column, e.g. Condition("timestamp", "BETWEEN", (start, end)) or
+Condition("timestamp", ">=", start). Wrapping the column in a function such as
+DATE(timestamp) disables pruning.
+
+Run daily, e.g. from cron, to add upcoming months and expire old ones:
+    uv run src/partitions.py --months-ahead 3 --retention-months 12
+"""
+
+import argparse
+import re
+from dataclasses import replace
+from datetime import date
+
+import config
+from connection import DatabaseConnection
+
+FUTURE_PARTITION = "p_future"
+PARTITION_NAME = re.compile(r"^p(\d{4})(\d{2})$")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """Returns the first day of the month `months` after month's month, negative goes back."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+
+def partition_month(name: str) -> date | None:
+    """Returns the month a partition holds, or None for partitions not named pYYYYMM."""
+    match = PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return date(int(match[1]), int(match[2]), 1)
+
+
+def partition_definition(month: date) -> str:
+    return f"PARTITION {partition_name(month)} VALUES LESS THAN ('{add_months(month, 1):%Y-%m-%d}')"
+
+
+class PartitionManager:
+    """Adds future monthly partitions and expires old ones with DROP PARTITION.
+
+    Expects the table to be partitioned BY RANGE COLUMNS on a date column, with one
+    pYYYYMM partition per month followed by a p_future catch-all, as orders is in
+    sql/create_relational_db.sql.
+
+    Example:
+        partitions = PartitionManager("orders", connection)
+        partitions.maintain(months_ahead=3, retention_months=12)
+    """
+
+    def __init__(self, table_name: str, connection: DatabaseConnection) -> None:
+        self.table_name: str = table_name
+        self.connection: DatabaseConnection = connection
+
+    def list_partitions(self) -> list[str]:
+        """Returns the table's partition names in partition order.
+
+        Raises:
+            ValueError: If the table is not partitioned.
+        """
+        with self.connection.cursor() as cur:
+            cur.execute(
+                "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s "
+                "ORDER BY PARTITION_ORDINAL_POSITION",
+                [self.table_name],
+            )
+            names = [row[0] for row in cur.fetchall() if row[0] is not None]
+        if not names:
+            raise ValueError(f"Table {self.table_name} is not partitioned")
+        return names
+
+    def monthly_partitions(self) -> list[date]:
+        return [month for month in map(partition_month, self.list_partitions()) if month is not None]
+
+    def ensure_future_partitions(self, months_ahead: int = 3, today: date | None = None) -> list[str]:
+        """Splits new monthly partitions off p_future up to months_ahead months after today.
+
+        Run it regularly, e.g. through main() from a daily job, so rows never land in
+        p_future where they could not be dropped by month. Splitting an empty p_future is a metadata change.
+
+        Args:
+            months_ahead: How many months after the current one should have a partition.
+            today: The current date, defaults to date.today().
+
+        Raises:
+            ValueError: If months_ahead is negative.
+
+        Returns:
+            list[str]: The names of the partitions that were added.
+        """
+        if months_ahead < 0:
+            raise ValueError("months_ahead must not be negative")
+
+        current = month_start(today or date.today())
+        existing = self.monthly_partitions()
+        first_new = add_months(existing[-1], 1) if existing else current
+        new_months = []
+        month = first_new
+        while month <= add_months(current, months_ahead):
+            new_months.append(month)
+            month = add_months(month, 1)
+
+        if new_months:
+            definitions = [partition_definition(month) for month in new_months]
+            definitions.append(f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE)")
+            with self.connection.cursor() as cur:
+                cur.execute(
+                    f"ALTER TABLE {self.table_name} REORGANIZE PARTITION {FUTURE_PARTITION} "
+                    f"INTO ({', '.join(definitions)})"
+                )
+        return [partition_name(month) for month in new_months]
+
+    def drop_partitions_before(self, cutoff: date) -> list[str]:
+        """Drops every monthly partition whose rows are all older than cutoff's month.
+
+        Dropping a partition removes its data file instead of deleting row by row,
+        so it takes the same time however many rows the month holds.
+
+        Args:
+            cutoff: Partitions for months before this date's month are dropped.
+
+        Returns:
+            list[str]: The names of the partitions that were dropped.
+        """
+        cutoff_month = month_start(cutoff)
+        expired = [
+            partition_name(month) for month in self.monthly_partitions() if month < cutoff_month
+        ]
+        if expired:
+            with self.connection.cursor() as cur:
+                cur.execute(f"ALTER TABLE {self.table_name} DROP PARTITION {', '.join(expired)}")
+        return expired
+
+    def expire(self, retention_months: int, today: date | None = None) -> list[str]:
+        """Keeps the current month and the previous retention_months - 1 months, dropping the rest.
+
+        Raises:
+            ValueError: If retention_months is not positive.
+
+        Returns:
+            list[str]: The names of the partitions that were dropped.
+        """
+        if retention_months < 1:
+            raise ValueError("retention_months must be positive")
+        current = month_start(today or date.today())
+        return self.drop_partitions_before(add_months(current, 1 - retention_months))
+
+    def maintain(
+        self,
+        months_ahead: int = 3,
+        retention_months: int | None = None,
+        today: date | None = None,
+    ) -> tuple[list[str], list[str]]:
+        """Adds upcoming monthly partitions and, if retention_months is given, expires old ones.
+
+        Returns:
+            tuple[list[str], list[str]]: The names of the added and the dropped partitions.
+        """
+        added = self.ensure_future_partitions(months_ahead, today)
+        dropped = [] if retention_months is None else self.expire(retention_months, today)
+        return added, dropped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add future monthly partitions and expire old ones")
+    parser.add_argument("--table", default="orders")
+    parser.add_argument("--months-ahead", type=int, default=3)
+    parser.add_argument("--retention-months", type=int, default=None, help="omit to keep all months")
+    args = parser.parse_args()
+
+    with DatabaseConnection(replace(config.dbconfig, database=config.RELATIONAL_DB_NAME)) as connection:
+        added, dropped = PartitionManager(args.table, connection).maintain(
+            args.months_ahead, args.retention_months)
+    print(f"added partitions: {', '.join(added) or 'none'}")
+    print(f"dropped partitions: {', '.join(dropped) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Sequence
+
+ROW_FORMATS = ("tuple", "record", "block")
+
+
+def _field_name(column: str) -> str:
+    """Turns a result column such as "COUNT(*)" or "SUM(price)" into an attribute name."""
+    return re.sub(r"\W+", "_", column).strip("_").lower() or "col"
+
+
+@lru_cache(maxsize=128)
+def record_type(columns: tuple[str, ...]) -> type:
+    """Returns the namedtuple class for a column signature, created once and reused.
+
+    Namedtuples have empty __slots__, so a record costs the same as a plain tuple
+    while its columns stay accessible by name.
+
+    Args:
+        columns: The column names from cursor.description.
+
+    Returns:
+        type: A namedtuple class, invalid or duplicate names are renamed to _0, _1...
+    """
+    return namedtuple("Record", [_field_name(col) for col in columns], rename=True)
+
+
+class RowBlock:
+    """Result rows stored in one flat list with per-column offsets.
+
+    Avoids a tuple object per row, row i's values are values[i * width:(i + 1) * width].
+
+    Example:
+        block = orders.select(["order_id", "timestamp"], row_format="block")
+        block.column("order_id")
+        block[0].timestamp
+    """
+
+    __slots__ = ("columns", "offsets", "values", "width")
+
+    def __init__(self, columns: Sequence[str], values: list[Any] | None = None) -> None:
+        self.columns = tuple(columns)
+        self.offsets = {_field_name(col): offset for offset, col in enumerate(self.columns)}
+        self.width = len(self.columns)
+        self.values = values if values is not None else []
+
+    def extend(self, rows: Iterable[Sequence[Any]]) -> None:
+        for row in rows:
+            self.values.extend(row)
+
+    def __len__(self) -> int:
+        return len(self.values) // self.width if self.width else 0
+
+    def __getitem__(self, index: int) -> tuple:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("RowBlock index out of range")
+        start = index * self.width
+        return record_type(self.columns)._make(self.values[start:start + self.width])
+
+    def __iter__(self) -> Iterator[tuple]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def column(self, name: str) -> list[Any]:
+        """Returns every value of one column.
+
+        Raises:
+            KeyError: If the column is not in the result.
+        """
+        return self.values[self.offsets[_field_name(name)]::self.width]
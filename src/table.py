@@ -1,6 +1,8 @@
 from typing import Any, Iterable, Optional, Hashable
 
 from connection import DatabaseConnection
+from filters import Aggregate, Desc, Filters, to_expression
+from rows import ROW_FORMATS, RowBlock, record_type
 
 
 class Table:
@@ -8,6 +10,8 @@ class Table:
     VALID COLS ["id", "date_time", "customer_name", "customer_email", "product_name", "product_price"]
     """
 
+    FETCH_BATCH_SIZE = 10_000
+
     def __init__(self, table_name: str, connection: DatabaseConnection) -> None:
         self.table_name: str = table_name
         self.connection: DatabaseConnection = connection
@@ -27,18 +31,20 @@ class Table:
             "*"
         }
 
-    def validate_columns(self, cols: Iterable[str]) -> None:
+    def validate_columns(self, cols: Iterable[str], allow_star: bool = False) -> None:
         """Validates supplied columns is in the whitelist columns to prevent sql injection
         by applying the set difference operation.
 
             Args:
                 cols: The user supplied iterable of columns to operate on
+                allow_star: If "*" is allowed, only true for select columns and COUNT(*)
 
             Raises:
                 ValueError: If the column is not in the whitelist of column names.
 
         """
-        invalid_cols = set(cols) - self.valid_columns
+        valid_columns = self.valid_columns if allow_star else self.valid_columns - {"*"}
+        invalid_cols = set(cols) - valid_columns
         if invalid_cols:
             raise ValueError(
                 f"Invalid column: {invalid_cols} is not in valid columns: {self.valid_columns}")
@@ -87,60 +93,132 @@ class Table:
             cur.executemany(sql_string, values)
         self.connection.commit()
 
+    def _build_where(self, filters: Filters) -> tuple[str, list[Any]]:
+        """Compiles filters to a WHERE clause after validating every referenced column.
+
+        Args:
+            filters: dict of "=" conditions, a Condition, an And/Or group or a list of conditions.
+
+        Raises:
+            ValueError: If a column is not in the whitelist or the filters are empty.
+
+        Returns:
+            tuple[str, list[Any]]: The WHERE clause and the values to bind.
+        """
+        expression = to_expression(filters)
+        self.validate_columns(expression.columns())
+        where_string, values = expression.compile()
+        return f" WHERE {where_string}", values
+
+    def _order_term(self, item: str | Aggregate | Desc) -> str:
+        """Compiles one ORDER BY entry after validating its column.
+
+        Args:
+            item: a column, "-column" for descending, an Aggregate or a Desc wrapping either.
+
+        Raises:
+            ValueError: If the column is not in the whitelist.
+
+        Returns:
+            str: The ORDER BY term.
+        """
+        descending = isinstance(item, Desc)
+        expression = item.expression if descending else item
+        if isinstance(expression, str) and expression.startswith("-"):
+            descending, expression = True, expression[1:]
+
+        if isinstance(expression, Aggregate):
+            self.validate_columns([expression.column], allow_star=True)
+            term = expression.compile()
+        else:
+            self.validate_columns([expression])
+            term = expression
+        return f"{term} DESC" if descending else term
+
     def select(
         self,
-        cols: Iterable[str],
-        filters: Optional[dict[str, Any]] = None,
+        cols: Iterable[str | Aggregate],
+        filters: Optional[Filters] = None,
         limit: int | None = None,
-    ) -> list[Any]:
-        """_summary_
+        order_by: Optional[Iterable[str | Aggregate | Desc]] = None,
+        group_by: Optional[Iterable[str]] = None,
+        row_format: str = "tuple",
+    ) -> list[Any] | RowBlock:
+        """Selects cols from the table, filtering, grouping and ordering on the server.
 
         Args:
-            cols (Iterable[str]): _description_
-            filters: optional dict for WHERE clause only supports "=" operator..
-            limit (int | None, optional): _description_. Defaults to None.
+            cols (Iterable[str | Aggregate]): columns or aggregates such as Aggregate("COUNT") to select.
+            filters: optional WHERE clause, either a dict of "=" conditions or Condition/And/Or expressions.
+            limit (int | None, optional): maximum number of rows to return. Defaults to None.
+            order_by: optional columns or aggregates to order by, prefix a column with "-" or wrap
+                it in Desc, e.g. Desc(Aggregate("COUNT")), for descending order.
+            group_by: optional columns to group aggregates by.
+            row_format: "tuple" for the cursor's tuples, "record" for namedtuples with
+                columns accessible by name or "block" for a single RowBlock. Defaults to "tuple".
 
         Raises:
-            TypeError: _description_
-            ValueError: _description_
+            TypeError: If limit is not an integer
+            ValueError: If limit is not positive, row_format is unknown or a column is not in the whitelist
 
         Returns:
-            list[Any]: _description_
+            list[Any] | RowBlock: The rows in the requested row_format.
         """
+        if row_format not in ROW_FORMATS:
+            raise ValueError(f"Invalid row format: {row_format} is not in valid row formats: {ROW_FORMATS}")
+
         if limit is not None:
             if not isinstance(limit, int):
                 raise TypeError("Limit must be an integer")
             if limit < 1:
                 raise ValueError("Limit must be positive")
 
-        with self.connection.cursor() as cur:
-            self.validate_columns(cols)
-            column_string = ", ".join(cols)
-            
+        # Unbuffered so compact rows are built batch by batch instead of next to a full copy of tuples
+        with self.connection.cursor(buffered=row_format == "tuple") as cur:
+            cols = list(cols)
+            self.validate_columns(
+                (col.column if isinstance(col, Aggregate) else col for col in cols), allow_star=True)
+            column_string = ", ".join(col.compile() if isinstance(col, Aggregate) else col for col in cols)
+
             values = []
             sql_string = f"SELECT {column_string} FROM {self.table_name}"
-            
+
             if filters:
-                self.validate_columns(filters.keys())
-                where_list = [f"{col} = %s" for col in filters.keys()]
-                where_string = " AND ".join(where_list)
-                sql_string += f" WHERE {where_string}"
-                values.extend(filters.values())
+                where_string, where_values = self._build_where(filters)
+                sql_string += where_string
+                values.extend(where_values)
+
+            if group_by:
+                group_by = list(group_by)
+                self.validate_columns(group_by)
+                sql_string += f" GROUP BY {', '.join(group_by)}"
+
+            if order_by:
+                sql_string += f" ORDER BY {', '.join(self._order_term(item) for item in order_by)}"
 
             if limit is not None:
                 sql_string += " LIMIT %s"
                 values.append(limit)
 
             cur.execute(sql_string, values)
-            results = cur.fetchall()
+            if row_format == "tuple":
+                results = cur.fetchall()
+            else:
+                columns = tuple(description[0] for description in cur.description)
+                results = RowBlock(columns) if row_format == "block" else []
+                make_record = record_type(columns)._make
+                while batch := cur.fetchmany(self.FETCH_BATCH_SIZE):
+                    if row_format == "block":
+                        results.extend(batch)
+                    else:
+                        results.extend(map(make_record, batch))
         return results
 
-    def update(self, data: dict[str, Any], filters: dict[str, Any]) -> None:
+    def update(self, data: dict[str, Any], filters: Filters) -> None:
         """Updates the table with data dictionary with the filters dictionary supplying where clause
 
         Args:
             values: dictionary containing columns and values to update
-            filter: dictionary containing filters. The key is a column with the value being the condition.
+            filters: dict of "=" conditions or Condition/And/Or expressions for the WHERE clause.
 
         Raises: ValueError if data dictionary is empty
         """
@@ -149,42 +227,34 @@ class Table:
             if not data:
                 raise ValueError("Cannot update: empty data dictionary")
             self.validate_columns(data)
-            self.validate_columns(filters)
 
             set_list = [f"{col} = %s" for col in data.keys()]
             set_string = ", ".join(set_list)
 
-            where_list = [f"{col} = %s" for col in filters.keys()]
-            where_string = " AND ".join(where_list)
+            where_string, where_values = self._build_where(filters)
 
-            values = list(data.values()) + list(filters.values())
+            values = list(data.values()) + where_values
 
-            sql_string = (
-                f"""UPDATE {self.table_name} SET {set_string} WHERE {where_string}"""
-            )
+            sql_string = f"UPDATE {self.table_name} SET {set_string}{where_string}"
             cur.execute(sql_string, values)
 
         self.connection.commit()
 
-    def delete(self, filters: dict[str, Any]) -> None:
+    def delete(self, filters: Filters) -> None:
         """Deletes values from columns with the condition from filters
 
         Args:
-            filters (dict[str, Any]): _description_
+            filters (Filters): dict of "=" conditions or Condition/And/Or expressions for the WHERE clause.
 
         Raises:
             ValueError: If supplied filters dict is empty
         """
         with self.connection.cursor() as cur:
-            self.validate_columns(filters.keys())
-
             if not filters:
                 raise ValueError("No condition in filters dict, cannot delete")
             else:
-                where_list = [f"{col} = %s" for col in filters.keys()]
-                where_string = " AND ".join(where_list)
+                where_string, values = self._build_where(filters)
 
-                sql_string = f"DELETE FROM {self.table_name} WHERE {where_string}"
-                values = list(filters.values())
+                sql_string = f"DELETE FROM {self.table_name}{where_string}"
 
                 cur.execute(sql_string, values)
@@ -0,0 +1,29 @@
+"""
+Shared fixtures for the unit tests.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def mock_connection_factory():
+    """Return a function creating fake database connections and their cursor."""
+    def make_mock_connection():
+        mock_conn = Mock()
+        mock_cursor = Mock()
+
+        # Make cursor work with 'with' statement
+        mock_conn.cursor.return_value.__enter__ = Mock(return_value=mock_cursor)
+        mock_conn.cursor.return_value.__exit__ = Mock(return_value=None)
+
+        return mock_conn, mock_cursor
+
+    return make_mock_connection
+
+
+@pytest.fixture
+def mock_connection(mock_connection_factory):
+    """Create a fake database connection."""
+    return mock_connection_factory()
@@ -0,0 +1,134 @@
+"""
+Unit tests for QueryExecutor.
+
+Run:
+    pytest tests/unit/test_executor.py -v
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+import executor
+from executor import QueryExecutor, SelectQuery
+
+
+@pytest.fixture
+def connections(monkeypatch, mock_connection_factory):
+    """Replace DatabaseConnection with fakes whose select returns the bound values."""
+    created = []
+
+    def fake_connection(config):
+        mock_conn, mock_cursor = mock_connection_factory()
+        last_params = []
+
+        def execute(sql, params=None):
+            # Let later submitted queries finish first
+            if params and params[0] == "slow":
+                time.sleep(0.05)
+            last_params[:] = params or []
+
+        mock_cursor.execute.side_effect = execute
+        mock_cursor.fetchall.side_effect = lambda: [tuple(last_params)]
+        mock_conn.thread = threading.get_ident()
+        mock_conn.cursor_mock = mock_cursor
+        created.append(mock_conn)
+        return mock_conn
+
+    monkeypatch.setattr(executor, "DatabaseConnection", fake_connection)
+    return created
+
+
+def test_run_returns_results_in_submission_order(connections):
+    """Test that run keeps submission order even when earlier queries finish last."""
+    queries = [
+        SelectQuery("products", ("product_id",), filters={"product_name": name})
+        for name in ["slow", "Laptop", "Mouse"]
+    ]
+
+    with QueryExecutor(Mock(), max_workers=3) as query_executor:
+        results = query_executor.run(queries)
+
+    assert results == [[("slow",)], [("Laptop",)], [("Mouse",)]]
+
+
+def test_run_as_completed_yields_submission_index(connections):
+    """Test that run_as_completed yields fast queries first with their index."""
+    queries = [
+        SelectQuery("products", ("product_id",), filters={"product_name": name})
+        for name in ["slow", "Laptop"]
+    ]
+
+    with QueryExecutor(Mock(), max_workers=2) as query_executor:
+        results = list(query_executor.run_as_completed(queries))
+
+    assert results[0] == (1, [("Laptop",)])
+    assert sorted(results) == [(0, [("slow",)]), (1, [("Laptop",)])]
+
+
+def test_connections_are_limited_and_closed(connections):
+    """Test that each worker opens at most one connection and close releases them."""
+    queries = [SelectQuery("orders", ("order_id",), limit=n) for n in range(1, 20)]
+
+    with QueryExecutor(Mock(), max_workers=2) as query_executor:
+        query_executor.run(queries)
+
+    assert 1 <= len(connections) <= 2
+    assert len({conn.thread for conn in connections}) == len(connections)
+    for conn in connections:
+        conn.close.assert_called_once()
+
+
+def test_timeout_sets_server_execution_limit(connections):
+    """Test that the per-query timeout is applied as max_execution_time in milliseconds."""
+    with QueryExecutor(Mock(), max_workers=1, timeout=1.5) as query_executor:
+        query_executor.run([SelectQuery("orders", ("order_id",))])
+
+    first_call = connections[0].cursor_mock.execute.call_args_list[0]
+    assert first_call.args == ("SET SESSION max_execution_time = %s", [1500])
+
+
+def test_sub_millisecond_timeout_keeps_a_limit(connections):
+    """Test that a timeout below 1 ms is not rounded to 0, which MySQL treats as no limit."""
+    with QueryExecutor(Mock(), max_workers=1, timeout=0.0004) as query_executor:
+        query_executor.run([SelectQuery("orders", ("order_id",))])
+
+    first_call = connections[0].cursor_mock.execute.call_args_list[0]
+    assert first_call.args == ("SET SESSION max_execution_time = %s", [1])
+
+
+def test_client_timeout_raises_when_server_does_not_answer(connections):
+    """Test that the caller stops waiting when a query outlives the timeout."""
+    query_executor = QueryExecutor(Mock(), max_workers=1, timeout=0.01)
+    query_executor.CLIENT_TIMEOUT_MARGIN = 0
+    slow = SelectQuery("products", ("product_id",), filters={"product_name": "slow"})
+
+    with query_executor:
+        with pytest.raises(TimeoutError):
+            query_executor.run([slow])
+        with pytest.raises(TimeoutError):
+            list(query_executor.run_as_completed([slow]))
+
+
+def test_dropped_connection_is_reopened(connections):
+    """Test that a worker replaces its connection after it dropped."""
+    with QueryExecutor(Mock(), max_workers=1) as query_executor:
+        query_executor.run([SelectQuery("orders", ("order_id",))])
+        connections[0].is_connected.return_value = False
+        results = query_executor.run([SelectQuery("orders", ("order_id",), limit=5)])
+
+    assert len(connections) == 2
+    assert results == [[(5,)]]
+    connections[1].close.assert_called_once()
+    connections[0].connection.close.assert_called_once()
+
+
+def test_invalid_arguments_raise_error():
+    """Test that a non positive concurrency limit or timeout is rejected."""
+    with pytest.raises(ValueError, match="max_workers"):
+        QueryExecutor(Mock(), max_workers=0)
+
+    with pytest.raises(ValueError, match="timeout"):
+        QueryExecutor(Mock(), timeout=0)
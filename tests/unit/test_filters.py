@@ -0,0 +1,102 @@
+"""
+Unit tests for the filter expressions compiled by Table.
+
+Run:
+    pytest tests/unit/test_filters.py -v
+"""
+
+import pytest
+
+from filters import Aggregate, And, Condition, Or, to_expression
+
+
+def test_condition_compiles_comparison():
+    """Test that comparison operators bind a single value."""
+    assert Condition("price", ">=", 100).compile() == ("price >= %s", [100])
+
+
+def test_condition_compiles_null_checks_without_values():
+    """Test that IS NULL and IS NOT NULL bind no values."""
+    assert Condition("email", "IS NULL").compile() == ("email IS NULL", [])
+    assert Condition("email", "IS NOT NULL").compile() == ("email IS NOT NULL", [])
+
+
+def test_condition_with_invalid_operator_raises_error():
+    """Test that operators outside the whitelist are rejected."""
+    with pytest.raises(ValueError, match="Invalid operator"):
+        Condition("price", "; DROP TABLE orders", 1)
+
+
+def test_condition_with_empty_in_raises_error():
+    """Test that an empty IN list is rejected instead of producing invalid SQL."""
+    with pytest.raises(ValueError, match="IN requires"):
+        Condition("product_id", "IN", [])
+
+
+def test_condition_without_between_pair_raises_error():
+    """Test that BETWEEN without a (low, high) pair raises ValueError instead of TypeError."""
+    with pytest.raises(ValueError, match="BETWEEN requires"):
+        Condition("timestamp", "BETWEEN")
+
+    with pytest.raises(ValueError, match="BETWEEN requires"):
+        Condition("timestamp", "BETWEEN", ("2025-03-01",))
+
+
+def test_comparison_with_none_raises_error():
+    """Test that comparing with None points to IS NULL instead of compiling to "= NULL"."""
+    with pytest.raises(ValueError, match="IS NULL"):
+        Condition("email", "=", None)
+
+
+def test_between_and_in_with_none_raise_error():
+    """Test that NULL bounds and NULL IN members are rejected like NULL comparisons."""
+    with pytest.raises(ValueError, match="IS NULL"):
+        Condition("timestamp", "BETWEEN", (None, None))
+
+    with pytest.raises(ValueError, match="IS NULL"):
+        Condition("product_id", "IN", [1, None])
+
+
+def test_in_accepts_generators():
+    """Test that IN values are materialized once."""
+    condition = Condition("product_id", "IN", (n for n in range(3)))
+
+    assert condition.compile() == ("product_id IN (%s, %s, %s)", [0, 1, 2])
+
+
+def test_nested_groups_are_parenthesized():
+    """Test that nested groups keep their precedence."""
+    expression = Or(
+        And(Condition("customer_id", "=", 1), Condition("product_id", "=", 2)),
+        Condition("order_id", "IN", (3, 4)),
+    )
+
+    assert expression.compile() == (
+        "(customer_id = %s AND product_id = %s) OR order_id IN (%s, %s)",
+        [1, 2, 3, 4],
+    )
+    assert expression.columns() == {"customer_id", "product_id", "order_id"}
+
+
+def test_to_expression_converts_dict_to_equality():
+    """Test that dict filters keep their "=" and AND semantics."""
+    expression = to_expression({"customer_name": "egan", "product_id": 3})
+
+    assert expression == And(Condition("customer_name", "=", "egan"), Condition("product_id", "=", 3))
+
+
+def test_to_expression_converts_dict_none_to_is_null():
+    """Test that None in dict filters matches NULL rows instead of compiling to "= NULL"."""
+    assert to_expression({"email": None}).compile() == ("email IS NULL", [])
+
+
+def test_aggregate_requires_column_except_count():
+    """Test that only COUNT may aggregate over *."""
+    assert Aggregate("COUNT").compile() == "COUNT(*)"
+    assert Aggregate("SUM", "price").compile() == "SUM(price)"
+
+    with pytest.raises(ValueError):
+        Aggregate("SUM")
+
+    with pytest.raises(ValueError, match="Invalid aggregate"):
+        Aggregate("DROP", "price")
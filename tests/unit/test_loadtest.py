@@ -0,0 +1,199 @@
+"""
+Unit tests for the load generator helpers.
+
+Run:
+    pytest tests/unit/test_loadtest.py -v
+"""
+
+import random
+import time
+from datetime import datetime
+from unittest.mock import Mock
+
+import mysql.connector
+import pytest
+from mysql.connector import errorcode
+
+import loadtest
+from loadtest import (
+    LoadReport, LoadTestConfig, OperationStats, SyntheticOrders, percentile, run_load_test, run_operation,
+    run_worker,
+)
+
+
+@pytest.fixture
+def data():
+    """Create a generator over three customers and two products."""
+    return SyntheticOrders([0, 1, 2], [10, 11], 100, datetime(2025, 3, 1), datetime(2025, 4, 1))
+
+
+def test_percentile_uses_nearest_rank():
+    """Test percentiles on a known distribution."""
+    values = [float(n) for n in range(100, 0, -1)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([], 95) == 0.0
+
+
+def test_percentile_rounds_rank_up_on_odd_lengths():
+    """Test that nearest-rank rounds up instead of to the even rank."""
+    assert percentile([5.0, 1.0, 3.0, 2.0, 4.0], 50) == 3.0
+    assert percentile([float(n) for n in range(1, 11)], 25) == 3.0
+    assert percentile([1.0, 2.0, 3.0], 0) == 1.0
+
+
+def test_config_rejects_unknown_operation():
+    """Test that the mix only accepts CRUD operations."""
+    with pytest.raises(ValueError, match="Invalid operation"):
+        LoadTestConfig(mix={"truncate": 1.0})
+
+
+def test_config_rejects_negative_weight():
+    """Test that a negative weight is rejected even when the weights sum to more than zero."""
+    with pytest.raises(ValueError, match="negative weight"):
+        LoadTestConfig(mix={"insert": -1.0, "select": 2.0})
+
+
+def test_synthetic_orders_hand_out_unique_ids(data):
+    """Test that inserted ids are unique, only added ids are picked and delete removes them."""
+    rng = random.Random(0)
+    rows = [data.new_order(rng) for _ in range(5)]
+    assert data.existing_order(rng) is None
+    for row in rows:
+        data.add_order(row["order_id"], row["timestamp"])
+
+    assert [row["order_id"] for row in rows] == [100, 101, 102, 103, 104]
+    assert all(row["customer_id"] in data.customer_ids for row in rows)
+    assert all(datetime(2025, 3, 1) <= row["timestamp"] <= datetime(2025, 4, 1) for row in rows)
+
+    deleted = {data.existing_order(rng, remove=True) for _ in range(5)}
+    assert deleted == {(row["order_id"], row["timestamp"]) for row in rows}
+    assert data.existing_order(rng) is None
+
+
+def test_run_worker_counts_errors_deadlocks_and_lock_timeouts(data):
+    """Test that failed operations are rolled back and deadlocks and lock wait timeouts are counted apart."""
+    connection = Mock()
+    calls = []
+
+    def runner(operation, orders, data, rng):
+        calls.append(operation)
+        if len(calls) % 3 == 0:
+            raise mysql.connector.Error(errno=errorcode.ER_LOCK_DEADLOCK)
+        if len(calls) % 5 == 0:
+            raise mysql.connector.Error(errno=errorcode.ER_DUP_ENTRY)
+        if len(calls) % 7 == 0:
+            raise mysql.connector.Error(errno=errorcode.ER_LOCK_WAIT_TIMEOUT)
+        return True
+
+    load_config = LoadTestConfig(workers=1, rate=1000, mix={"select": 1.0})
+    stats = run_worker(lambda: connection, data, load_config, random.Random(0), time.monotonic() + 0.05, runner)
+
+    select_stats = stats["select"]
+    assert select_stats.total == len(calls)
+    assert select_stats.deadlocks == len(calls) // 3
+    assert select_stats.lock_timeouts == len([n for n in range(1, len(calls) + 1) if n % 7 == 0 and n % 3 and n % 5])
+    assert select_stats.errors == len(
+        [n for n in range(1, len(calls) + 1) if n % 3 == 0 or n % 5 == 0 or n % 7 == 0])
+    assert connection.rollback.call_count == select_stats.errors
+    # Paced to 1000 ops/s for 50 ms
+    assert len(calls) <= 60
+
+
+def test_failed_operations_keep_order_pool_consistent(data):
+    """Test that failed inserts never enter the pool and failed deletes put their id back."""
+    orders = Mock()
+    orders.insert.side_effect = mysql.connector.Error(errno=errorcode.ER_DUP_ENTRY)
+    rng = random.Random(0)
+
+    with pytest.raises(mysql.connector.Error):
+        run_operation("insert", orders, data, rng)
+    assert data.existing_order(rng) is None
+    assert run_operation("delete", orders, data, rng) is False
+
+    data.add_order(7, datetime(2025, 3, 14, 15, 24, 45))
+    orders.delete.side_effect = mysql.connector.Error(errno=errorcode.ER_LOCK_DEADLOCK)
+    with pytest.raises(mysql.connector.Error):
+        run_operation("delete", orders, data, rng)
+    assert data.existing_order(rng) == (7, datetime(2025, 3, 14, 15, 24, 45))
+    orders.delete.assert_called_once_with({"order_id": 7, "timestamp": datetime(2025, 3, 14, 15, 24, 45)})
+
+
+def test_run_worker_skips_operations_that_did_nothing(data):
+    """Test that update and delete without an order are not counted."""
+    load_config = LoadTestConfig(workers=1, mix={"update": 1.0})
+    stats = run_worker(Mock, data, load_config, random.Random(0), time.monotonic() + 0.01, lambda *args: False)
+
+    assert stats["update"].total == 0
+
+
+def test_run_worker_measures_from_scheduled_start(data):
+    """Test that with a rate, queueing behind slow operations counts toward latency."""
+    def runner(operation, orders, data, rng):
+        time.sleep(0.02)
+        return True
+
+    load_config = LoadTestConfig(workers=1, rate=200, mix={"select": 1.0})
+    stats = run_worker(Mock, data, load_config, random.Random(0), time.monotonic() + 0.1, runner)
+
+    latencies = stats["select"].latencies
+    # Operations are scheduled every 5 ms but take 20 ms, so later ones queue
+    assert latencies[-1] > latencies[0] + 0.02
+
+
+def test_report_summary_includes_totals():
+    """Test that the summary reports every operation, totals and connection samples."""
+    report = LoadReport(
+        elapsed=2.0,
+        stats={"insert": OperationStats([0.001, 0.003]), "select": OperationStats([0.002], errors=2, deadlocks=1, lock_timeouts=1)},
+        connection_samples=[(0.0, 3), (1.0, 9)],
+    )
+
+    summary = report.summary()
+
+    assert "insert" in summary and "select" in summary and "total" in summary
+    assert "deadlock rate 20.00%" in summary
+    assert "lock wait timeout rate 20.00%" in summary
+    assert "1.0: 9" in summary
+
+
+def test_run_worker_reopens_lost_connection(data):
+    """Test that a lost server connection is closed and replaced instead of failing every operation."""
+    opened = []
+
+    def connect():
+        opened.append(Mock())
+        return opened[-1]
+
+    def runner(operation, orders, data, rng):
+        if len(opened) == 1:
+            raise mysql.connector.Error(errno=errorcode.CR_SERVER_LOST)
+        return True
+
+    load_config = LoadTestConfig(workers=1, rate=1000, mix={"select": 1.0})
+    stats = run_worker(connect, data, load_config, random.Random(0), time.monotonic() + 0.02, runner)
+
+    assert len(opened) == 2
+    assert stats["select"].errors == 1
+    assert len(stats["select"].latencies) > 0
+    opened[0].connection.close.assert_called_once()
+    opened[0].rollback.assert_not_called()
+    opened[1].close.assert_called_once()
+
+
+def test_run_load_test_fails_loudly_when_a_worker_dies(monkeypatch, data):
+    """Test that a worker crashing with a non database error is not silently dropped from the report."""
+    def failing_worker(connect, data, load_config, rng, deadline):
+        raise KeyError("boom")
+
+    monkeypatch.setattr(loadtest, "DatabaseConnection", lambda config: Mock())
+    monkeypatch.setattr(loadtest, "load_synthetic_orders", lambda connection: data)
+    monkeypatch.setattr(loadtest, "sample_connections", lambda *args: None)
+    monkeypatch.setattr(loadtest, "run_worker", failing_worker)
+
+    with pytest.raises(RuntimeError, match="2 of 2 load test workers failed") as excinfo:
+        run_load_test(Mock(), LoadTestConfig(workers=2, duration=0.01))
+
+    assert isinstance(excinfo.value.__cause__, KeyError)
@@ -0,0 +1,97 @@
+"""
+Unit tests for monthly partition management.
+
+Run:
+    pytest tests/unit/test_partitions.py -v
+"""
+
+from datetime import date
+import pytest
+
+from partitions import PartitionManager, add_months, partition_definition, partition_month
+
+
+@pytest.fixture
+def partitions(mock_connection):
+    """Create a PartitionManager over a fake orders table partitioned from March to May 2025."""
+    mock_conn, mock_cursor = mock_connection
+    mock_cursor.fetchall.return_value = [("p202503",), ("p202504",), ("p202505",), ("p_future",)]
+    return PartitionManager("orders", mock_conn), mock_cursor
+
+
+def test_add_months_crosses_years():
+    """Test month arithmetic across year boundaries."""
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+
+
+def test_partition_names_round_trip():
+    """Test partition naming and parsing."""
+    assert partition_definition(date(2025, 12, 1)) == "PARTITION p202512 VALUES LESS THAN ('2026-01-01')"
+    assert partition_month("p202512") == date(2025, 12, 1)
+    assert partition_month("p_future") is None
+
+
+def test_ensure_future_partitions_splits_future(partitions):
+    """Test that missing months up to months_ahead are split off p_future."""
+    manager, mock_cursor = partitions
+
+    added = manager.ensure_future_partitions(months_ahead=2, today=date(2025, 6, 15))
+
+    assert added == ["p202506", "p202507", "p202508"]
+    sql_string = mock_cursor.execute.call_args[0][0]
+    assert sql_string == (
+        "ALTER TABLE orders REORGANIZE PARTITION p_future INTO ("
+        "PARTITION p202506 VALUES LESS THAN ('2025-07-01'), "
+        "PARTITION p202507 VALUES LESS THAN ('2025-08-01'), "
+        "PARTITION p202508 VALUES LESS THAN ('2025-09-01'), "
+        "PARTITION p_future VALUES LESS THAN (MAXVALUE))"
+    )
+
+
+def test_ensure_future_partitions_is_noop_when_covered(partitions):
+    """Test that nothing is altered when the partitions already cover months_ahead."""
+    manager, mock_cursor = partitions
+
+    assert manager.ensure_future_partitions(months_ahead=1, today=date(2025, 4, 2)) == []
+    assert mock_cursor.execute.call_count == 1  # only the information_schema lookup
+
+
+def test_drop_partitions_before_keeps_cutoff_month(partitions):
+    """Test that only months before the cutoff month are dropped, never p_future."""
+    manager, mock_cursor = partitions
+
+    dropped = manager.drop_partitions_before(date(2025, 5, 20))
+
+    assert dropped == ["p202503", "p202504"]
+    assert mock_cursor.execute.call_args[0][0] == "ALTER TABLE orders DROP PARTITION p202503, p202504"
+
+
+def test_expire_keeps_retention_months(partitions):
+    """Test that expire keeps the current month and the months before it within retention."""
+    manager, _ = partitions
+
+    assert manager.expire(retention_months=2, today=date(2025, 5, 1)) == ["p202503"]
+
+    with pytest.raises(ValueError):
+        manager.expire(retention_months=0)
+
+
+def test_maintain_adds_and_expires(partitions):
+    """Test that maintain runs both the future partitions and the retention step."""
+    manager, mock_cursor = partitions
+
+    added, dropped = manager.maintain(months_ahead=0, retention_months=1, today=date(2025, 6, 3))
+
+    assert added == ["p202506"]
+    assert dropped == ["p202503", "p202504", "p202505"]
+    assert manager.maintain(months_ahead=0, today=date(2025, 5, 3)) == ([], [])
+
+
+def test_unpartitioned_table_raises_error(partitions):
+    """Test that a table without partitions is rejected."""
+    manager, mock_cursor = partitions
+    mock_cursor.fetchall.return_value = [(None,)]
+
+    with pytest.raises(ValueError, match="not partitioned"):
+        manager.list_partitions()
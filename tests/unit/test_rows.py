@@ -0,0 +1,52 @@
+"""
+Unit tests for the compact row formats returned by Table.select.
+
+Run:
+    pytest tests/unit/test_rows.py -v
+"""
+
+import pytest
+
+from rows import RowBlock, record_type
+
+
+def test_record_type_is_cached_per_column_signature():
+    """Test that the record class is generated once per column signature."""
+    assert record_type(("order_id", "timestamp")) is record_type(("order_id", "timestamp"))
+    assert record_type(("order_id",)) is not record_type(("order_id", "timestamp"))
+
+
+def test_record_type_names_aggregate_columns():
+    """Test that aggregate result columns become valid attribute names."""
+    Record = record_type(("product_id", "COUNT(*)", "SUM(price)"))
+    record = Record._make((3, 12, 99.5))
+
+    assert record.product_id == 3
+    assert record.count == 12
+    assert record.sum_price == 99.5
+    assert record == (3, 12, 99.5)
+
+
+def test_row_block_stores_rows_flat():
+    """Test that a row block keeps one flat list and exposes rows and columns by name."""
+    block = RowBlock(["order_id", "customer_id"])
+    block.extend([(1, 10), (2, 20)])
+    block.extend([(3, 30)])
+
+    assert block.values == [1, 10, 2, 20, 3, 30]
+    assert len(block) == 3
+    assert block.column("customer_id") == [10, 20, 30]
+    assert block[1].order_id == 2
+    assert block[-1] == (3, 30)
+    assert list(block) == [(1, 10), (2, 20), (3, 30)]
+
+
+def test_row_block_index_and_column_errors():
+    """Test that out of range rows and unknown columns raise."""
+    block = RowBlock(["order_id"])
+
+    with pytest.raises(IndexError):
+        block[0]
+
+    with pytest.raises(KeyError):
+        block.column("price")
@@ -12,22 +12,10 @@ from unittest.mock import Mock
 
 import pytest
 
+from filters import Aggregate, Condition, Desc, Or
 from table import Table
 
 
-@pytest.fixture
-def mock_connection():
-    """Create a fake database connection."""
-    mock_conn = Mock()
-    mock_cursor = Mock()
-    
-    # Make cursor work with 'with' statement
-    mock_conn.cursor.return_value.__enter__ = Mock(return_value=mock_cursor)
-    mock_conn.cursor.return_value.__exit__ = Mock(return_value=None)
-    
-    return mock_conn, mock_cursor
-
-
 @pytest.fixture
 def crud(mock_connection):
     """Create CRUD instance with fake connection."""
@@ -232,15 +220,189 @@ def test_select_with_all_options(crud):
     
     assert sql_string == "SELECT id, customer_name FROM orders_combined WHERE customer_name = %s AND customer_email = %s LIMIT %s"
     assert params == ["name", "fake@mail.com", 2]
-    
-    
+
+
+def test_select_with_condition_filters(crud):
+    """Tests that condition expressions compile to a parameterized WHERE clause."""
+    crud_instance, mock_cursor, _ = crud
+    mock_cursor.fetchall.return_value = []
+
+    crud_instance.select(
+        ["id"],
+        filters=[
+            Condition("date_time", "BETWEEN", ("2025-03-01", "2025-04-01")),
+            Or(Condition("product_price", ">=", 500), Condition("product_name", "IN", ["Laptop", "Mouse"])),
+        ],
+        order_by=["-date_time", "id"],
+    )
+
+    sql_string = mock_cursor.execute.call_args[0][0]
+    params = mock_cursor.execute.call_args[0][1]
+
+    assert sql_string == (
+        "SELECT id FROM orders_combined WHERE date_time BETWEEN %s AND %s "
+        "AND (product_price >= %s OR product_name IN (%s, %s)) ORDER BY date_time DESC, id"
+    )
+    assert params == ["2025-03-01", "2025-04-01", 500, "Laptop", "Mouse"]
+
+
+def test_select_with_aggregates(crud):
+    """Tests that aggregates and GROUP BY are compiled into the query."""
+    crud_instance, mock_cursor, _ = crud
+    mock_cursor.fetchall.return_value = []
+
+    crud_instance.select(
+        ["product_name", Aggregate("COUNT"), Aggregate("SUM", "product_price")],
+        filters=Condition("customer_email", "IS NOT NULL"),
+        group_by=["product_name"],
+        limit=3,
+    )
+
+    sql_string = mock_cursor.execute.call_args[0][0]
+    params = mock_cursor.execute.call_args[0][1]
+
+    assert sql_string == (
+        "SELECT product_name, COUNT(*), SUM(product_price) FROM orders_combined "
+        "WHERE customer_email IS NOT NULL GROUP BY product_name LIMIT %s"
+    )
+    assert params == [3]
+
+
+def test_select_ordered_by_aggregate(crud):
+    """Tests the top products by COUNT report query."""
+    crud_instance, mock_cursor, _ = crud
+    mock_cursor.fetchall.return_value = []
+
+    crud_instance.select(
+        ["product_id", Aggregate("COUNT")],
+        group_by=["product_id"],
+        order_by=[Desc(Aggregate("COUNT")), Aggregate("MAX", "date_time"), Desc("product_id")],
+        limit=5,
+    )
+
+    sql_string = mock_cursor.execute.call_args[0][0]
+    assert sql_string == (
+        "SELECT product_id, COUNT(*) FROM orders_combined GROUP BY product_id "
+        "ORDER BY COUNT(*) DESC, MAX(date_time), product_id DESC LIMIT %s"
+    )
+
+    with pytest.raises(ValueError, match="Invalid column"):
+        crud_instance.select(["id"], order_by=[Desc("bad_column")])
+
+
+def test_select_with_invalid_filter_column_raises_error(crud):
+    """Tests that columns inside condition expressions are validated."""
+    crud_instance, mock_cursor, _ = crud
+
+    with pytest.raises(ValueError, match="Invalid column"):
+        crud_instance.select(["id"], filters=Or(Condition("id", "=", 1), Condition("1=1; --", "=", 1)))
+
+    with pytest.raises(ValueError, match="Invalid column"):
+        crud_instance.select(["id"], order_by=["-bad_column"])
+
+    mock_cursor.execute.assert_not_called()
+
+
+def test_select_with_star_outside_select_columns_raises_error(crud):
+    """Tests that "*" is only accepted as a select column or in COUNT(*)."""
+    crud_instance, mock_cursor, _ = crud
+    mock_cursor.fetchall.return_value = []
+
+    crud_instance.select(["*"])
+    crud_instance.select([Aggregate("COUNT")])
+
+    with pytest.raises(ValueError, match="Invalid column"):
+        crud_instance.select(["id"], filters=Condition("*", "=", 1))
+    with pytest.raises(ValueError, match="Invalid column"):
+        crud_instance.select(["id"], group_by=["*"])
+    with pytest.raises(ValueError, match="Invalid column"):
+        crud_instance.select(["id"], order_by=["-*"])
+    with pytest.raises(ValueError, match="Invalid column"):
+        crud_instance.delete(Condition("*", "IS NOT NULL"))
+    with pytest.raises(ValueError, match="Invalid column"):
+        crud_instance.insert({"*": 1})
+
+    assert mock_cursor.execute.call_count == 2
+
+
+def test_select_as_records(crud):
+    """Tests that record rows are fetched unbuffered in batches and accessible by name."""
+    crud_instance, mock_cursor, mock_conn = crud
+    mock_cursor.description = [("id",), ("customer_name",)]
+    mock_cursor.fetchmany.side_effect = [[(1, "egan"), (2, "nage")], [(3, "jess")], []]
+
+    results = crud_instance.select(["id", "customer_name"], row_format="record")
+
+    mock_conn.cursor.assert_called_once_with(buffered=False)
+    mock_cursor.fetchall.assert_not_called()
+    assert len(results) == 3
+    assert results[2].customer_name == "jess"
+    assert results[0] == (1, "egan")
+
+
+def test_select_as_block(crud):
+    """Tests that block rows come back as a single RowBlock."""
+    crud_instance, mock_cursor, _ = crud
+    mock_cursor.description = [("id",), ("product_price",)]
+    mock_cursor.fetchmany.side_effect = [[(1, 9.5), (2, 3.0)], []]
+
+    block = crud_instance.select(["id", "product_price"], row_format="block")
+
+    assert block.values == [1, 9.5, 2, 3.0]
+    assert block.column("product_price") == [9.5, 3.0]
+
+
+def test_select_with_invalid_row_format_raises_error(crud):
+    """Tests that unknown row formats are rejected before querying."""
+    crud_instance, mock_cursor, _ = crud
+
+    with pytest.raises(ValueError, match="Invalid row format"):
+        crud_instance.select(["id"], row_format="dict")
+
+    mock_cursor.execute.assert_not_called()
 
 
 # ============================================
 # Tests for update method
 # ============================================
 
+def test_update_with_condition_filters(crud):
+    """Tests that update accepts condition expressions."""
+    crud_instance, mock_cursor, mock_conn = crud
+
+    crud_instance.update({"product_price": 10}, Condition("id", "<", 5))
+
+    sql_string = mock_cursor.execute.call_args[0][0]
+    params = mock_cursor.execute.call_args[0][1]
+
+    assert sql_string == "UPDATE orders_combined SET product_price = %s WHERE id < %s"
+    assert params == [10, 5]
+    mock_conn.commit.assert_called_once()
+
+
 
 # ============================================
 # Tests for delete method
-# ============================================
\ No newline at end of file
+# ============================================
+
+def test_delete_with_dict_filters(crud):
+    """Tests that dict filters still compile to "=" conditions joined with AND."""
+    crud_instance, mock_cursor, _ = crud
+
+    crud_instance.delete({"product_name": "Laptop", "customer_name": "egan"})
+
+    sql_string = mock_cursor.execute.call_args[0][0]
+    params = mock_cursor.execute.call_args[0][1]
+
+    assert sql_string == "DELETE FROM orders_combined WHERE product_name = %s AND customer_name = %s"
+    assert params == ["Laptop", "egan"]
+
+
+def test_delete_with_empty_filters_raises_error(crud):
+    """Tests that delete refuses to run without a condition."""
+    crud_instance, mock_cursor, _ = crud
+
+    with pytest.raises(ValueError, match="No condition"):
+        crud_instance.delete({})
+
+    mock_cursor.execute.assert_not_called()